@@ -0,0 +1,215 @@
+"""Shared fixtures for the API test-suite."""
+
+from contextlib import contextmanager
+from datetime import date
+
+import pytest
+from fastapi.testclient import TestClient
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event
+from sqlalchemy.orm import configure_mappers
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine
+
+from src.api import app
+from src.db import get_session
+from src.models.models import (
+    Doente,
+    Internamento,
+    LesaoInalatorialEnum,
+    SexoEnum,
+)
+
+# Sessions the app's get_session dependency hands out, innermost last. A
+# plain stack rather than a ContextVar: anyio runs async tests in a task
+# that does not inherit context set by sync fixtures.
+_bound_sessions: list[Session] = []
+
+
+def _get_current_session() -> Session:
+    return _bound_sessions[-1]
+
+
+@contextmanager
+def _bind(session: Session):
+    _bound_sessions.append(session)
+    try:
+        yield session
+    finally:
+        _bound_sessions.pop()
+
+
+def pytest_configure(config):
+    """Configure the ORM mappers before the first test runs.
+
+    SQLAlchemy resolves relationships lazily on first use, which otherwise
+    lands on whichever test happens to query first.
+    """
+    configure_mappers()
+
+
+@pytest.fixture(name='engine', scope='session')
+def engine_fixture():
+    """Create the in-memory test database once per test session."""
+    # A named shared-cache database keeps a single in-memory schema that
+    # the StaticPool connection serves to every test in the session.
+    engine = create_engine(
+        'sqlite+pysqlite:///file:testdb?mode=memory&cache=shared&uri=true',
+        connect_args={'check_same_thread': False, 'uri': True},
+        poolclass=StaticPool,
+    )
+
+    # pysqlite defers BEGIN on its own, which breaks SAVEPOINT handling;
+    # let SQLAlchemy emit it so the per-test rollback really undoes writes.
+    @event.listens_for(engine, 'connect')
+    def _disable_pysqlite_transactions(dbapi_connection, _):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, 'begin')
+    def _emit_begin(connection):
+        connection.exec_driver_sql('BEGIN')
+
+    # The database was just created and is empty, so skip the per-table
+    # existence checks.
+    SQLModel.metadata.create_all(engine, checkfirst=False)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture(name='connection')
+def connection_fixture(engine):
+    """Open a connection whose outer transaction is rolled back afterwards.
+
+    Modules that share rows across tests can override this fixture with a
+    wider scope; ``session`` still isolates every test in a SAVEPOINT.
+    """
+    connection = engine.connect()
+    transaction = connection.begin()
+    yield connection
+    transaction.rollback()
+    connection.close()
+
+
+@pytest.fixture(name='session')
+def session_fixture(connection):
+    """Create a test session whose changes are rolled back afterwards.
+
+    Each test runs inside its own SAVEPOINT and commits issued by the API
+    only release a nested one, so every test starts from the state the
+    connection had without recreating the schema.
+    """
+    nested = connection.begin_nested()
+    # Objects stay loaded after commit, so fixtures need no refresh() to
+    # read back the primary keys assigned on flush. Autoflush is off: test
+    # inserts are flushed by the commit (or an explicit flush()) instead of
+    # before every query.
+    session = Session(
+        bind=connection,
+        join_transaction_mode='create_savepoint',
+        autoflush=False,
+        expire_on_commit=False,
+    )
+    yield session
+    session.close()
+    nested.rollback()
+
+
+@pytest.fixture(name='query_counter')
+def query_counter_fixture(engine):
+    """Record every SQL statement sent to the test database.
+
+    Yields the list the statements are appended to; clear it right before
+    the call under test to count only the queries that call issues.
+    """
+    statements = []
+
+    def _record(_conn, _cursor, statement, *_):
+        statements.append(statement)
+
+    event.listen(engine, 'before_cursor_execute', _record)
+    yield statements
+    event.remove(engine, 'before_cursor_execute', _record)
+
+
+@pytest.fixture(name='sample_doente')
+def sample_doente_fixture(session: Session):
+    """Create a sample patient for testing."""
+    doente = Doente(
+        nome='Test Patient',
+        numero_processo=123456,
+        sexo=SexoEnum.M,
+        morada='Test Street',
+    )
+    session.add(doente)
+    session.commit()
+    return doente
+
+
+@pytest.fixture(name='sample_internamento')
+def sample_internamento_fixture(session: Session, sample_doente: Doente):
+    """Create a sample internamento for testing."""
+    internamento = Internamento(
+        doente_id=sample_doente.id,
+        numero_internamento=789012,
+        data_entrada=date(2025, 9, 15),
+        ASCQ_total=20,
+        lesao_inalatoria=LesaoInalatorialEnum.NAO,
+    )
+    session.add(internamento)
+    session.commit()
+    return internamento
+
+
+@pytest.fixture(name='app_client', scope='session')
+def app_client_fixture():
+    """Create the TestClient shared by the whole test session."""
+    # Routes are called by their exact path, so a redirect would only hide
+    # a wrong URL behind an extra round-trip.
+    return TestClient(app, follow_redirects=False)
+
+
+@pytest.fixture(name='bind_session', scope='session')
+def bind_session_fixture():
+    """Override ``get_session`` once for the whole test session.
+
+    Yields a context manager that routes requests to the given session
+    while it is open, so tests swap the bound session instead of editing
+    ``app.dependency_overrides``.
+    """
+    app.dependency_overrides[get_session] = _get_current_session
+    yield _bind
+    app.dependency_overrides.pop(get_session, None)
+
+
+@pytest.fixture(name='client')
+def client_fixture(app_client: TestClient, session: Session, bind_session):
+    """Route the shared client to the current test session."""
+    with bind_session(session):
+        yield app_client
+
+
+@pytest.fixture(name='anyio_backend', scope='session')
+def anyio_backend_fixture():
+    """Run ``anyio``-marked tests on asyncio only."""
+    return 'asyncio'
+
+
+@pytest.fixture(name='app_aclient', scope='session')
+async def app_aclient_fixture(anyio_backend):
+    """Create the async client shared by the whole test session.
+
+    Requests go straight to the ASGI app on the session's event loop, so
+    no per-test portal or loop is started.
+    """
+    transport = ASGITransport(app=app)
+    async with AsyncClient(
+        transport=transport, base_url='http://testserver'
+    ) as client:
+        yield client
+
+
+@pytest.fixture(name='aclient')
+def aclient_fixture(app_aclient: AsyncClient, session: Session, bind_session):
+    """Route the shared async client to the current test session."""
+    with bind_session(session):
+        yield app_aclient
@@ -0,0 +1,9 @@
+"""Constants shared by the API test modules."""
+
+# HTTP Status Code Constants
+HTTP_200_OK = 200
+HTTP_404_NOT_FOUND = 404
+HTTP_422_UNPROCESSABLE_ENTITY = 422
+
+# Test Constants
+MIN_TEST_DATA_COUNT = 2
@@ -0,0 +1,48 @@
+"""Helpers shared by the API test modules.
+
+Setup data does not need to travel through FastAPI routing and request
+validation, so the ``seed_*`` helpers insert it on the test session instead.
+"""
+
+from httpx import Response
+from sqlmodel import Session
+
+from src.models.models import AgenteInfeccioso, DoenteMedicacao, TipoInfecao
+
+
+def seed_agente(session: Session, nome: str, tipo: str) -> int:
+    """Insert an agente infeccioso and return its id."""
+    agente = AgenteInfeccioso(nome=nome, tipo_agente=tipo)
+    session.add(agente)
+    session.flush()
+    return agente.id
+
+
+def seed_tipo_infecao(session: Session, tipo_infeccao: str, local: str) -> int:
+    """Insert a tipo de infecção and return its id."""
+    tipo = TipoInfecao(tipo_infeccao=tipo_infeccao, local=local)
+    session.add(tipo)
+    session.flush()
+    return tipo.id
+
+
+def seed_doentes_medicacao(
+    session: Session, doente_id: int, medicacao_id: int, count: int
+) -> None:
+    """Insert ``count`` doente-medicacao rows in a single flush."""
+    session.add_all([
+        DoenteMedicacao(
+            doente_id=doente_id, medicacao=medicacao_id, nota=f'Nota {i}'
+        )
+        for i in range(count)
+    ])
+    session.flush()
+
+
+def expect(response: Response, status: int = 200, **fields) -> dict:
+    """Check the status and the given body fields; return the decoded body."""
+    assert response.status_code == status, response.text
+    body = response.json()
+    for key, value in fields.items():
+        assert body[key] == value, key
+    return body
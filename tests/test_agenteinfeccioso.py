@@ -1,32 +1,12 @@
-import pytest
 from fastapi.testclient import TestClient
-from sqlmodel import Session, SQLModel
+from sqlmodel import Session
 
-from src.api import app
-from src.db import engine
+from tests.helpers import seed_agente
 
 HTTP_OK = 200
 
 
-# Setup a test session dependency override
-@pytest.fixture(name="session")
-def session_fixture():
-    SQLModel.metadata.create_all(engine)
-    with Session(engine) as session:
-        yield session
-    # (Optional) Do not drop to keep other tests intact
-
-
-@app.dependency_overrides.get
-def override_get_session():  # type: ignore
-    with Session(engine) as session:
-        yield session
-
-
-client = TestClient(app)
-
-
-def test_create_agente_infeccioso_without_codigo():
+def test_create_agente_infeccioso_without_codigo(client: TestClient):
     payload = {"nome": "Staphylococcus aureus", "tipo_agente": "Bacteria"}
     resp = client.post("/agentes_infecciosos", json=payload)
     assert resp.status_code == HTTP_OK, resp.text
@@ -37,7 +17,7 @@ def test_create_agente_infeccioso_without_codigo():
     assert data.get("subtipo_agent") is None
 
 
-def test_create_agente_infeccioso_with_codigo():
+def test_create_agente_infeccioso_with_codigo(client: TestClient):
     payload = {
         "nome": "Escherichia coli",
         "tipo_agente": "Bacteria",
@@ -50,7 +30,7 @@ def test_create_agente_infeccioso_with_codigo():
     assert data.get("subtipo_agent") is None
 
 
-def test_create_agente_infeccioso_with_subtipo_agent():
+def test_create_agente_infeccioso_with_subtipo_agent(client: TestClient):
     payload = {
         "nome": "Candida albicans",
         "tipo_agente": "Fungus",
@@ -66,7 +46,11 @@ def test_create_agente_infeccioso_with_subtipo_agent():
     assert data["subtipo_agent"] == payload["subtipo_agent"]
 
 
-def test_list_agentes_infecciosos_contains_codigo_field():
+def test_list_agentes_infecciosos_contains_codigo_field(
+    client: TestClient, session: Session
+):
+    # Each test is rolled back, so seed the row the listing should return
+    seed_agente(session, "Klebsiella pneumoniae", "Bacteria")
     resp = client.get("/agentes_infecciosos")
     assert resp.status_code == HTTP_OK
     data = resp.json()
@@ -75,7 +59,7 @@ def test_list_agentes_infecciosos_contains_codigo_field():
     assert any("subtipo_agent" in item for item in data)
 
 
-def test_get_single_agente_infeccioso():
+def test_get_single_agente_infeccioso(client: TestClient):
     # Create one with code and subtipo_agent
     payload = {
         "nome": "Pseudomonas aeruginosa",
@@ -94,7 +78,7 @@ def test_get_single_agente_infeccioso():
     assert data["subtipo_agent"] == payload["subtipo_agent"]
 
 
-def test_patch_agente_infeccioso():
+def test_patch_agente_infeccioso(client: TestClient):
     # First create an agent
     create_payload = {
         "nome": "Test Agent",
@@ -119,7 +103,7 @@ def test_patch_agente_infeccioso():
     assert data["codigo_snomedct"] == update_payload["codigo_snomedct"]  # Updated
 
 
-def test_patch_agente_infeccioso_single_field():
+def test_patch_agente_infeccioso_single_field(client: TestClient):
     # First create an agent
     create_payload = {
         "nome": "Another Test Agent",
@@ -144,7 +128,7 @@ def test_patch_agente_infeccioso_single_field():
     assert data["codigo_snomedct"] == update_payload["codigo_snomedct"]  # Updated
 
 
-def test_patch_agente_infeccioso_not_found():
+def test_patch_agente_infeccioso_not_found(client: TestClient):
     # Test updating non-existent agent
     update_payload = {
         "subtipo_agent": "Should Fail"
@@ -154,7 +138,7 @@ def test_patch_agente_infeccioso_not_found():
     assert "not found" in patch_resp.json()["detail"].lower()
 
 
-def test_patch_agente_infeccioso_empty_update():
+def test_patch_agente_infeccioso_empty_update(client: TestClient):
     # First create an agent
     create_payload = {
         "nome": "Empty Update Test",
@@ -174,7 +158,7 @@ def test_patch_agente_infeccioso_empty_update():
     assert data["tipo_agente"] == create_payload["tipo_agente"]
 
 
-def test_delete_agente_infeccioso():
+def test_delete_agente_infeccioso(client: TestClient):
     # First create an agent
     create_payload = {
         "nome": "Agent to Delete",
@@ -197,7 +181,7 @@ def test_delete_agente_infeccioso():
     assert get_resp.status_code == 404
 
 
-def test_delete_agente_infeccioso_not_found():
+def test_delete_agente_infeccioso_not_found(client: TestClient):
     # Try to delete non-existent agent
     delete_resp = client.delete("/agentes_infecciosos/999999")
     assert delete_resp.status_code == 404
@@ -2,14 +2,7 @@
 Tests for AgenteQueimadura functionality.
 """
 
-import tracemalloc
-
-import pytest
 from fastapi.testclient import TestClient
-from sqlmodel import Session, SQLModel, create_engine
-from sqlmodel.pool import StaticPool
-
-from src.api import app, get_session
 
 # HTTP status codes
 HTTP_200_OK = 200
@@ -17,47 +10,6 @@ HTTP_201_CREATED = 201
 HTTP_404_NOT_FOUND = 404
 HTTP_422_UNPROCESSABLE_ENTITY = 422
 
-# Start tracemalloc to track memory allocations
-tracemalloc.start()
-
-
-@pytest.fixture(name='engine')
-def engine_fixture():
-    """Create a test database engine."""
-    engine = create_engine(
-        'sqlite://',
-        connect_args={'check_same_thread': False},
-        poolclass=StaticPool,
-    )
-    SQLModel.metadata.create_all(engine)
-    yield engine
-    # Ensure engine is properly disposed
-    engine.dispose()
-
-
-@pytest.fixture(name='session')
-def session_fixture(engine):
-    """Create a test database session."""
-    with Session(engine) as session:
-        yield session
-        # Session is automatically closed by context manager
-
-
-@pytest.fixture(name='client')
-def client_fixture(session: Session):
-    """Create a test client with the test database session."""
-
-    def get_session_override():
-        return session
-
-    app.dependency_overrides[get_session] = get_session_override
-
-    with TestClient(app) as client:
-        yield client
-
-    # Clean up
-    app.dependency_overrides.clear()
-
 
 def test_create_agente_queimadura(client: TestClient):
     """Test creating a new agente queimadura."""
@@ -121,7 +73,7 @@ def test_internamento_with_agente_queimadura_foreign_key(client: TestClient):
     """Test creating an internamento with agente queimadura foreign key."""
     # First create a patient
     patient_response = client.post(
-        '/doentes/',
+        '/doentes',
         json={
             'nome': 'Test Patient',
             'numero_processo': 12345,
@@ -1,21 +1,8 @@
 """Tests for antibiotic-related functionality."""
 
-import random
-import warnings
-from datetime import date
-
-import pytest
 from fastapi.testclient import TestClient
-from sqlmodel import Session
 
-from src.api import app
-from src.db import engine
-from src.models.models import (
-    Doente,
-    Internamento,
-    LesaoInalatorialEnum,
-    SexoEnum,
-)
+from src.models.models import Internamento
 
 # HTTP Status Code Constants
 HTTP_200_OK = 200
@@ -28,40 +15,6 @@ NON_EXISTENT_LARGE_ID = 999999
 MIN_TEST_DATA_COUNT = 2
 
 
-@pytest.fixture(name='client')
-def client_fixture():
-    """Create a test client for the FastAPI app."""
-    return TestClient(app)
-
-
-@pytest.fixture(name='session')
-def session_fixture():
-    """Create a test database session."""
-    with Session(engine) as session:
-        yield session
-        # Ensure session is properly closed
-        session.close()
-
-
-# Clean up any remaining connections after each test
-@pytest.fixture(autouse=True)
-def cleanup_connections():
-    """Clean up database connections after each test."""
-    # Filter out ResourceWarnings for unclosed database connections
-    warnings.filterwarnings(
-        "ignore",
-        message="unclosed database",
-        category=ResourceWarning
-    )
-    yield
-    # Dispose of all connections to prevent ResourceWarnings
-    try:
-        engine.dispose()
-    except Exception:
-        # Ignore any disposal errors in tests
-        pass
-
-
 class TestAntibiotico:
     """Test class for Antibiotico functionality."""
 
@@ -159,33 +112,12 @@ class TestIndicacaoAntibiotico:
 class TestInternamentoAntibiotico:
     """Test class for InternamentoAntibiotico functionality."""
 
-    def test_create_internamento_antibiotico_with_relationships(  # noqa: PLR6301
-        self, client: TestClient, session: Session
+    @staticmethod
+    def test_create_internamento_antibiotico_with_relationships(
+        client: TestClient, sample_internamento: Internamento
     ):
         """Test creating internamento antibiotico with relationships."""
-        # Create required data
-        # Generate a random unique patient number to avoid conflicts
-        random_num = random.randint(10000000, 99999999)
-        doente = Doente(
-            nome='Test Patient for Antibiotico',
-            numero_processo=random_num,
-            sexo=SexoEnum.M,
-            morada='Test Address',
-        )
-        session.add(doente)
-        session.commit()
-        session.refresh(doente)
-
-        internamento = Internamento(
-            numero_internamento=random_num + 1,  # Use different number
-            doente_id=doente.id,
-            data_entrada=date(2025, 9, 12),
-            ASCQ_total=20,
-            lesao_inalatoria=LesaoInalatorialEnum.NAO,
-        )
-        session.add(internamento)
-        session.commit()
-        session.refresh(internamento)
+        internamento = sample_internamento
 
         # Create antibiotico
         antibiotico_response = client.post(
@@ -217,33 +149,12 @@ class TestInternamentoAntibiotico:
         assert data['indicacao'] == indicacao_id
         assert 'id' in data
 
-    def test_create_internamento_antibiotico_minimal(  # noqa: PLR6301
-        self, client: TestClient, session: Session
+    @staticmethod
+    def test_create_internamento_antibiotico_minimal(
+        client: TestClient, sample_internamento: Internamento
     ):
         """Test creating internamento antibiotico with minimal data."""
-        # Create required data
-        # Generate a random unique patient number to avoid conflicts
-        random_num = random.randint(10000000, 99999999)
-        doente = Doente(
-            nome='Minimal Test Patient',
-            numero_processo=random_num,
-            sexo=SexoEnum.F,
-            morada='Minimal Address',
-        )
-        session.add(doente)
-        session.commit()
-        session.refresh(doente)
-
-        internamento = Internamento(
-            numero_internamento=random_num + 1,  # Use different number
-            doente_id=doente.id,
-            data_entrada=date(2025, 9, 12),
-            ASCQ_total=15,
-            lesao_inalatoria=LesaoInalatorialEnum.SIM,
-        )
-        session.add(internamento)
-        session.commit()
-        session.refresh(internamento)
+        internamento = sample_internamento
 
         # Create internamento antibiotico with just internamento_id
         response = client.post(
@@ -5,126 +5,102 @@ and their API endpoints.
 """
 
 from datetime import date
+from types import SimpleNamespace
 
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
-from sqlalchemy.pool import StaticPool
-from sqlmodel import Session, SQLModel
+from sqlmodel import Session
 
-from src.api import app, get_session
 from src.models.models import (
     Doente,
     Internamento,
     LesaoInalatorialEnum,
     SexoEnum,
 )
-
-# HTTP Status Code Constants
-HTTP_200_OK = 200
-HTTP_404_NOT_FOUND = 404
-HTTP_422_UNPROCESSABLE_ENTITY = 422
+from tests.constants import (
+    HTTP_200_OK,
+    HTTP_404_NOT_FOUND,
+    HTTP_422_UNPROCESSABLE_ENTITY,
+    MIN_TEST_DATA_COUNT,
+)
+from tests.helpers import seed_agente, seed_tipo_infecao
 
 # Test Constants
 NON_EXISTENT_ID = 999
 NON_EXISTENT_LARGE_ID = 999999
-MIN_TEST_DATA_COUNT = 2
-
-
-# Test database setup
-@pytest.fixture(name="session")
-def session_fixture():
-    """Create a test database session."""
-    engine = create_engine(
-        "sqlite:///",  # In-memory database
-        connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
-    )
-    SQLModel.metadata.create_all(engine)
-    with Session(engine) as session:
-        yield session
 
 
-@pytest.fixture(name="client")
-def client_fixture(session: Session):
-    """Create a test client with dependency override."""
-    def get_session_override():
-        return session
-
-    app.dependency_overrides[get_session] = get_session_override
-    client = TestClient(app)
-    yield client
-    app.dependency_overrides.clear()
-
-
-class TestAgenteInfeccioso:
-    """Test class for AgenteInfeccioso functionality."""
-
-    @staticmethod
-    def test_create_agente_infeccioso(client: TestClient):
-        """Test creating a new agente infeccioso."""
-        response = client.post(
+@pytest.fixture(name="api_ctx", scope="module")
+def api_ctx_fixture(engine, app_client: TestClient, bind_session):
+    """Share one client, session and seeded references per module.
+
+    Everything runs inside a single outer transaction that is rolled back
+    when the module finishes.
+    """
+    conn = engine.connect()
+    trans = conn.begin()
+    # Autoflush is off so seeding several rows issues a single flush on
+    # commit instead of one per intermediate query.
+    session = Session(bind=conn, autoflush=False, expire_on_commit=False)
+    agente_id = seed_agente(session, "Staphylococcus epidermidis", "BACTERIA")
+    tipo_id = seed_tipo_infecao(session, "Infecção cutânea", "Pele")
+    with bind_session(session):
+        yield SimpleNamespace(
+            client=app_client,
+            session=session,
+            agente_id=agente_id,
+            tipo_id=tipo_id,
+        )
+    session.close()
+    trans.rollback()
+    conn.close()
+
+
+@pytest.mark.parametrize(
+    ("endpoint", "body", "key"),
+    [
+        (
             "/agentes_infecciosos",
-            json={
-                "nome": "Staphylococcus aureus",
-                "tipo_agente": "BACTERIA",
+            {"nome": "Staphylococcus aureus", "tipo_agente": "BACTERIA"},
+            "nome",
+        ),
+        (
+            "/tipos_infeccao",
+            {
+                "tipo_infeccao": "Infecção respiratória",
+                "local": "Aparelho respiratório",
             },
-        )
-        assert response.status_code == HTTP_200_OK
-        data = response.json()
-        assert data["nome"] == "Staphylococcus aureus"
-        assert data["tipo_agente"] == "BACTERIA"
-        assert "id" in data
+            "tipo_infeccao",
+        ),
+    ],
+    ids=["agente_infeccioso", "tipo_infecao"],
+)
+def test_crud_roundtrip(
+    api_ctx: SimpleNamespace, endpoint: str, body: dict, key: str
+):
+    """Test create, retrieve by ID and list for a lookup endpoint."""
+    client = api_ctx.client
+    response = client.post(endpoint, json=body)
+    assert response.status_code == HTTP_200_OK
+    created = response.json()
+    assert {field: created[field] for field in body} == body
 
-    @staticmethod
-    def test_get_all_agentes_infecciosos(client: TestClient):
-        """Test retrieving all agentes infecciosos."""
-        # Create test agentes
-        client.post(
-            "/agentes_infecciosos",
-            json={
-                "nome": "Pseudomonas aeruginosa",
-                "tipo_agente": "BACTERIA",
-            },
-        )
-        client.post(
-            "/agentes_infecciosos",
-            json={
-                "nome": "Candida albicans",
-                "tipo_agente": "FUNGO",
-            },
-        )
+    response = client.get(f"{endpoint}/{created['id']}")
+    assert response.status_code == HTTP_200_OK
+    assert response.json()[key] == body[key]
 
-        response = client.get("/agentes_infecciosos")
-        assert response.status_code == HTTP_200_OK
-        data = response.json()
-        assert len(data) >= MIN_TEST_DATA_COUNT
-        assert any(
-            agente["nome"] == "Pseudomonas aeruginosa" for agente in data
-        )
-        assert any(agente["nome"] == "Candida albicans" for agente in data)
+    response = client.get(endpoint)
+    assert response.status_code == HTTP_200_OK
+    assert any(item[key] == body[key] for item in response.json())
 
-    @staticmethod
-    def test_get_agente_infeccioso_by_id(client: TestClient):
-        """Test retrieving agente infeccioso by ID."""
-        create_response = client.post(
-            "/agentes_infecciosos",
-            json={
-                "nome": "Escherichia coli",
-                "tipo_agente": "BACTERIA",
-            },
-        )
-        agente_id = create_response.json()["id"]
 
-        response = client.get(f"/agentes_infecciosos/{agente_id}")
-        assert response.status_code == HTTP_200_OK
-        data = response.json()
-        assert data["nome"] == "Escherichia coli"
-        assert data["id"] == agente_id
+class TestAgenteInfeccioso:
+    """Test class for AgenteInfeccioso functionality."""
 
     @staticmethod
-    def test_get_nonexistent_agente_infeccioso(client: TestClient):
+    def test_get_nonexistent_agente_infeccioso(api_ctx: SimpleNamespace):
         """Test retrieving non-existent agente infeccioso."""
+        client = api_ctx.client
         response = client.get(f"/agentes_infecciosos/{NON_EXISTENT_ID}")
         assert response.status_code == HTTP_404_NOT_FOUND
         assert "not found" in response.json()["detail"].lower()
@@ -134,70 +110,9 @@ class TestTipoInfecao:
     """Test class for TipoInfecao functionality."""
 
     @staticmethod
-    def test_create_tipo_infecao(client: TestClient):
-        """Test creating a new tipo de infecção."""
-        response = client.post(
-            "/tipos_infeccao",
-            json={
-                "tipo_infeccao": "Infecção respiratória",
-                "local": "Aparelho respiratório",
-            },
-        )
-        assert response.status_code == HTTP_200_OK
-        data = response.json()
-        assert data["tipo_infeccao"] == "Infecção respiratória"
-        assert data["local"] == "Aparelho respiratório"
-        assert "id" in data
-
-    @staticmethod
-    def test_get_all_tipos_infeccao(client: TestClient):
-        """Test retrieving all tipos de infecção."""
-        # Create test tipos
-        client.post(
-            "/tipos_infeccao",
-            json={
-                "tipo_infeccao": "Infecção de ferida",
-                "local": "Ferida cirúrgica",
-            },
-        )
-        client.post(
-            "/tipos_infeccao",
-            json={
-                "tipo_infeccao": "Septicemia",
-                "local": "Sistémica",
-            },
-        )
-
-        response = client.get("/tipos_infeccao")
-        assert response.status_code == HTTP_200_OK
-        data = response.json()
-        assert len(data) >= MIN_TEST_DATA_COUNT
-        assert any(
-            tipo["tipo_infeccao"] == "Infecção de ferida" for tipo in data
-        )
-        assert any(tipo["tipo_infeccao"] == "Septicemia" for tipo in data)
-
-    @staticmethod
-    def test_get_tipo_infecao_by_id(client: TestClient):
-        """Test retrieving tipo de infecção by ID."""
-        create_response = client.post(
-            "/tipos_infeccao",
-            json={
-                "tipo_infeccao": "Infecção urinária",
-                "local": "Aparelho urinário",
-            },
-        )
-        tipo_id = create_response.json()["id"]
-
-        response = client.get(f"/tipos_infeccao/{tipo_id}")
-        assert response.status_code == HTTP_200_OK
-        data = response.json()
-        assert data["tipo_infeccao"] == "Infecção urinária"
-        assert data["id"] == tipo_id
-
-    @staticmethod
-    def test_get_nonexistent_tipo_infecao(client: TestClient):
+    def test_get_nonexistent_tipo_infecao(api_ctx: SimpleNamespace):
         """Test retrieving non-existent tipo de infecção."""
+        client = api_ctx.client
         response = client.get(f"/tipos_infeccao/{NON_EXISTENT_ID}")
         assert response.status_code == HTTP_404_NOT_FOUND
         assert "not found" in response.json()["detail"].lower()
@@ -207,9 +122,10 @@ class TestInfecao:
     """Test class for Infecao functionality."""
 
     def test_create_infecao_with_all_relationships(  # noqa: PLR6301
-        self, client: TestClient, session: Session
+        self, api_ctx: SimpleNamespace
     ):
         """Test creating infecção with all required relationships."""
+        client, session = api_ctx.client, api_ctx.session
         # Create required data first
         doente = Doente(
             nome="João Silva",
@@ -232,23 +148,8 @@ class TestInfecao:
         session.commit()
         session.refresh(internamento)
 
-        agente_response = client.post(
-            "/agentes_infecciosos",
-            json={
-                "nome": "Staphylococcus epidermidis",
-                "tipo_agente": "BACTERIA",
-            },
-        )
-        agente_id = agente_response.json()["id"]
-
-        tipo_response = client.post(
-            "/tipos_infeccao",
-            json={
-                "tipo_infeccao": "Infecção cutânea",
-                "local": "Pele",
-            },
-        )
-        tipo_id = tipo_response.json()["id"]
+        agente_id = api_ctx.agente_id
+        tipo_id = api_ctx.tipo_id
 
         # Create infecção
         response = client.post(
@@ -268,8 +169,9 @@ class TestInfecao:
         assert "id" in data
 
     @staticmethod
-    def test_create_infecao_invalid_internamento(client: TestClient):
+    def test_create_infecao_invalid_internamento(api_ctx: SimpleNamespace):
         """Test creating infecção with invalid internamento_id."""
+        client = api_ctx.client
         response = client.post(
             "/infeccoes",
             json={
@@ -284,9 +186,10 @@ class TestInfecao:
         assert "not found" in response.json()["detail"].lower()
 
     def test_create_infecao_invalid_agente(  # noqa: PLR6301
-        self, client: TestClient, session: Session
+        self, api_ctx: SimpleNamespace
     ):
         """Test creating infecção with invalid agente ID."""
+        client, session = api_ctx.client, api_ctx.session
         # Create required internamento
         doente = Doente(
             nome="Maria Santos",
@@ -323,9 +226,10 @@ class TestInfecao:
         assert "not found" in response.json()["detail"].lower()
 
     def test_create_infecao_invalid_tipo(  # noqa: PLR6301
-        self, client: TestClient, session: Session
+        self, api_ctx: SimpleNamespace
     ):
         """Test creating infecção with invalid tipo de infecção ID."""
+        client, session = api_ctx.client, api_ctx.session
         # Create required data
         doente = Doente(
             nome="Carlos Oliveira",
@@ -348,14 +252,7 @@ class TestInfecao:
         session.commit()
         session.refresh(internamento)
 
-        agente_response = client.post(
-            "/agentes_infecciosos",
-            json={
-                "nome": "Streptococcus pyogenes",
-                "tipo_agente": "BACTERIA",
-            },
-        )
-        agente_id = agente_response.json()["id"]
+        agente_id = api_ctx.agente_id
 
         response = client.post(
             "/infeccoes",
@@ -370,8 +267,9 @@ class TestInfecao:
         assert response.status_code in {400, 404}
         assert "not found" in response.json()["detail"].lower()
 
-    def test_get_all_infecoes(self, client: TestClient, session: Session):  # noqa: PLR6301
+    def test_get_all_infecoes(self, api_ctx: SimpleNamespace):  # noqa: PLR6301
         """Test retrieving all infecções."""
+        client, session = api_ctx.client, api_ctx.session
         # Create required data and infecções
         doente = Doente(
             nome="Ana Costa",
@@ -402,23 +300,8 @@ class TestInfecao:
         session.refresh(internamento1)
         session.refresh(internamento2)
 
-        agente_response = client.post(
-            "/agentes_infecciosos",
-            json={
-                "nome": "Enterococcus faecalis",
-                "tipo_agente": "BACTERIA",
-            },
-        )
-        agente_id = agente_response.json()["id"]
-
-        tipo_response = client.post(
-            "/tipos_infeccao",
-            json={
-                "tipo_infeccao": "Infecção gastrointestinal",
-                "local": "Aparelho digestivo",
-            },
-        )
-        tipo_id = tipo_response.json()["id"]
+        agente_id = api_ctx.agente_id
+        tipo_id = api_ctx.tipo_id
 
         # Create two infecções
         client.post(
@@ -445,8 +328,9 @@ class TestInfecao:
         data = response.json()
         assert len(data) >= MIN_TEST_DATA_COUNT
 
-    def test_get_infecao_by_id(self, client: TestClient, session: Session):  # noqa: PLR6301
+    def test_get_infecao_by_id(self, api_ctx: SimpleNamespace):  # noqa: PLR6301
         """Test retrieving infecção by ID."""
+        client, session = api_ctx.client, api_ctx.session
         # Create required data
         doente = Doente(
             nome="Pedro Almeida",
@@ -469,23 +353,8 @@ class TestInfecao:
         session.commit()
         session.refresh(internamento)
 
-        agente_response = client.post(
-            "/agentes_infecciosos",
-            json={
-                "nome": "Acinetobacter baumannii",
-                "tipo_agente": "BACTERIA",
-            },
-        )
-        agente_id = agente_response.json()["id"]
-
-        tipo_response = client.post(
-            "/tipos_infeccao",
-            json={
-                "tipo_infeccao": "Pneumonia nosocomial",
-                "local": "Pulmões",
-            },
-        )
-        tipo_id = tipo_response.json()["id"]
+        agente_id = api_ctx.agente_id
+        tipo_id = api_ctx.tipo_id
 
         create_response = client.post(
             "/infeccoes",
@@ -505,16 +374,18 @@ class TestInfecao:
         assert data["internamento_id"] == internamento.id
 
     @staticmethod
-    def test_get_nonexistent_infecao(client: TestClient):
+    def test_get_nonexistent_infecao(api_ctx: SimpleNamespace):
         """Test retrieving non-existent infecção."""
+        client = api_ctx.client
         response = client.get(f"/infeccoes/{NON_EXISTENT_ID}")
         assert response.status_code == HTTP_404_NOT_FOUND
         assert "not found" in response.json()["detail"].lower()
 
     def test_infecao_required_fields(  # noqa: PLR6301
-        self, client: TestClient, session: Session
+        self, api_ctx: SimpleNamespace
     ):
         """Test that required fields are validated."""
+        client, session = api_ctx.client, api_ctx.session
         # Create required data
         doente = Doente(
             nome="Isabel Santos",
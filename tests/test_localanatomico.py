@@ -1,28 +1,14 @@
 """Tests for LocalAnatomico API endpoints."""
 
-import pytest
 from fastapi.testclient import TestClient
 
-from src.api import app
-from src.db import get_session
+from tests.constants import (
+    HTTP_200_OK,
+    HTTP_404_NOT_FOUND,
+    HTTP_422_UNPROCESSABLE_ENTITY,
+)
 
-# HTTP Status Code Constants
-HTTP_200_OK = 200
-HTTP_404_NOT_FOUND = 404
-HTTP_422_UNPROCESSABLE_ENTITY = 422
-MIN_EXPECTED_RECORDS = 2
-
-
-@pytest.fixture
-def client():
-    """Create test client."""
-    return TestClient(app)
-
-
-@pytest.fixture
-def session():
-    """Create test database session."""
-    return next(get_session())
+EXPECTED_RECORDS = 2
 
 
 def test_create_local_anatomico(client: TestClient):
@@ -59,7 +45,7 @@ def test_get_all_locais_anatomicos(client: TestClient):
     response = client.get('/locais_anatomicos')
     assert response.status_code == HTTP_200_OK
     data = response.json()
-    assert len(data) >= MIN_EXPECTED_RECORDS
+    assert len(data) == EXPECTED_RECORDS
     assert all('local_anatomico' in item for item in data)
 
 
@@ -1,66 +1,24 @@
 # ruff: noqa: PLR6301, PLR2004, E501
-from datetime import date
+from types import SimpleNamespace
 
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy.pool import StaticPool
-from sqlmodel import Session, SQLModel, create_engine
+from pydantic import ValidationError
+from sqlmodel import Session
 
-from src.api import app
-from src.db import get_session
 from src.models.models import (
     Doente,
     DoenteMedicacao,
     Medicacao,
-    SexoEnum,
+    MedicacaoCreate,
 )
+from tests.helpers import seed_doentes_medicacao
 
 # Test constants
 HTTP_200_OK = 200
 HTTP_404_NOT_FOUND = 404
 HTTP_422_UNPROCESSABLE_ENTITY = 422
-
-
-@pytest.fixture(name="session")
-def session_fixture():
-    """Create a test database session."""
-    engine = create_engine(
-        "sqlite:///:memory:",
-        connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
-    )
-    SQLModel.metadata.create_all(engine)
-
-    with Session(engine) as session:
-        yield session
-
-
-@pytest.fixture(name="client")
-def client_fixture(session: Session):
-    """Create test client with database session."""
-    def get_session_override():
-        return session
-
-    app.dependency_overrides[get_session] = get_session_override
-    client = TestClient(app)
-    yield client
-    app.dependency_overrides.clear()
-
-
-@pytest.fixture(name="sample_doente")
-def sample_doente_fixture(session: Session):
-    """Create a sample patient for testing."""
-    doente = Doente(
-        nome="Test Patient",
-        numero_processo=12345,
-        data_nascimento=date(1990, 1, 1),
-        sexo=SexoEnum.M,
-        morada="Test Street"
-    )
-    session.add(doente)
-    session.commit()
-    session.refresh(doente)
-    return doente
+SEEDED_ROWS = 3
 
 
 @pytest.fixture(name="sample_medicacao")
@@ -73,10 +31,15 @@ def sample_medicacao_fixture(session: Session):
     )
     session.add(medicacao)
     session.commit()
-    session.refresh(medicacao)
     return medicacao
 
 
+@pytest.fixture(name="sample_refs")
+def sample_refs_fixture(sample_doente: Doente, sample_medicacao: Medicacao):
+    """Bundle the sample patient and medication used by link tests."""
+    return SimpleNamespace(doente=sample_doente, medicacao=sample_medicacao)
+
+
 class TestMedicacao:
     """Test cases for Medicacao model and API."""
 
@@ -139,15 +102,14 @@ class TestMedicacao:
         assert response.status_code == HTTP_404_NOT_FOUND
         assert response.json()["detail"] == "Medicacao not found"
 
-    def test_medicacao_required_fields(self, client: TestClient):
+    def test_medicacao_required_fields(self):
         """Test that nome_medicacao is required."""
         medicacao_data = {
             "classe_terapeutica": "Antibiótico"
         }
 
-        response = client.post("/medicacoes", json=medicacao_data)
-
-        assert response.status_code == HTTP_422_UNPROCESSABLE_ENTITY
+        with pytest.raises(ValidationError):
+            MedicacaoCreate.model_validate(medicacao_data)
 
 
 class TestDoenteMedicacao:
@@ -156,13 +118,12 @@ class TestDoenteMedicacao:
     def test_create_doente_medicacao(
         self,
         client: TestClient,
-        sample_doente: Doente,
-        sample_medicacao: Medicacao
+        sample_refs: SimpleNamespace
     ):
         """Test creating a new doente-medicacao relationship."""
         data = {
-            "doente_id": sample_doente.id,
-            "medicacao": sample_medicacao.id,
+            "doente_id": sample_refs.doente.id,
+            "medicacao": sample_refs.medicacao.id,
             "nota": "Tomar 500mg de 8 em 8 horas"
         }
 
@@ -170,8 +131,8 @@ class TestDoenteMedicacao:
 
         assert response.status_code == HTTP_200_OK
         response_data = response.json()
-        assert response_data["doente_id"] == sample_doente.id
-        assert response_data["medicacao"] == sample_medicacao.id
+        assert response_data["doente_id"] == sample_refs.doente.id
+        assert response_data["medicacao"] == sample_refs.medicacao.id
         assert response_data["nota"] == "Tomar 500mg de 8 em 8 horas"
         assert "id" in response_data
 
@@ -229,36 +190,31 @@ class TestDoenteMedicacao:
     def test_get_all_doentes_medicacao(
         self,
         client: TestClient,
-        sample_doente: Doente,
-        sample_medicacao: Medicacao
+        session: Session,
+        sample_refs: SimpleNamespace
     ):
         """Test getting all doente-medicacao relationships."""
-        # Create a relationship first
-        data = {
-            "doente_id": sample_doente.id,
-            "medicacao": sample_medicacao.id,
-            "nota": "Test relationship"
-        }
-        client.post("/doentes_medicacao", json=data)
+        seed_doentes_medicacao(
+            session, sample_refs.doente.id, sample_refs.medicacao.id, SEEDED_ROWS
+        )
 
         response = client.get("/doentes_medicacao")
 
         assert response.status_code == HTTP_200_OK
         response_data = response.json()
         assert isinstance(response_data, list)
-        assert len(response_data) >= 1
-        assert response_data[0]["doente_id"] == sample_doente.id
+        assert len(response_data) == SEEDED_ROWS
+        assert response_data[0]["doente_id"] == sample_refs.doente.id
 
     def test_get_doente_medicacao_by_id(
         self,
         client: TestClient,
-        sample_doente: Doente,
-        sample_medicacao: Medicacao
+        sample_refs: SimpleNamespace
     ):
         """Test getting a specific doente-medicacao by ID."""
         data = {
-            "doente_id": sample_doente.id,
-            "medicacao": sample_medicacao.id,
+            "doente_id": sample_refs.doente.id,
+            "medicacao": sample_refs.medicacao.id,
             "nota": "Test relationship"
         }
         create_response = client.post("/doentes_medicacao", json=data)
@@ -268,8 +224,8 @@ class TestDoenteMedicacao:
 
         assert response.status_code == HTTP_200_OK
         response_data = response.json()
-        assert response_data["doente_id"] == sample_doente.id
-        assert response_data["medicacao"] == sample_medicacao.id
+        assert response_data["doente_id"] == sample_refs.doente.id
+        assert response_data["medicacao"] == sample_refs.medicacao.id
         assert response_data["id"] == created_id
 
     def test_get_nonexistent_doente_medicacao(self, client: TestClient):
@@ -282,26 +238,22 @@ class TestDoenteMedicacao:
     def test_get_medicacoes_by_doente(
         self,
         client: TestClient,
-        sample_doente: Doente,
-        sample_medicacao: Medicacao
+        session: Session,
+        sample_refs: SimpleNamespace
     ):
         """Test getting medicacoes for a specific doente."""
-        # Create a relationship first
-        data = {
-            "doente_id": sample_doente.id,
-            "medicacao": sample_medicacao.id,
-            "nota": "Test relationship"
-        }
-        client.post("/doentes_medicacao", json=data)
+        seed_doentes_medicacao(
+            session, sample_refs.doente.id, sample_refs.medicacao.id, SEEDED_ROWS
+        )
 
-        response = client.get(f"/doentes/{sample_doente.id}/medicacoes")
+        response = client.get(f"/doentes/{sample_refs.doente.id}/medicacoes")
 
         assert response.status_code == HTTP_200_OK
         response_data = response.json()
         assert isinstance(response_data, list)
-        assert len(response_data) >= 1
-        assert response_data[0]["doente_id"] == sample_doente.id
-        assert response_data[0]["medicacao"] == sample_medicacao.id
+        assert len(response_data) == SEEDED_ROWS
+        assert response_data[0]["doente_id"] == sample_refs.doente.id
+        assert response_data[0]["medicacao"] == sample_refs.medicacao.id
 
     def test_get_medicacoes_by_nonexistent_doente(self, client: TestClient):
         """Test getting medicacoes for non-existent doente."""
@@ -324,73 +276,35 @@ class TestDoenteMedicacao:
 class TestDatabaseRelationships:
     """Test database relationships for medicacao tables."""
 
-    def test_medicacao_doente_relationship(
+    def test_relationships_all_directions(
         self,
         session: Session,
-        sample_doente: Doente,
-        sample_medicacao: Medicacao
+        sample_refs: SimpleNamespace
     ):
-        """Test the relationship between medicacao and doente."""
-        # Create a relationship
+        """Test every relationship direction on a single doente-medicacao."""
         doente_medicacao = DoenteMedicacao(
-            doente_id=sample_doente.id,
-            medicacao=sample_medicacao.id,
+            doente_id=sample_refs.doente.id,
+            medicacao=sample_refs.medicacao.id,
             nota="Test relationship"
         )
         session.add(doente_medicacao)
         session.commit()
+
+        # Refresh to load relationships
         session.refresh(doente_medicacao)
+        session.refresh(sample_refs.doente)
+        session.refresh(sample_refs.medicacao)
 
-        # Test forward relationship
+        # Test forward relationships
         assert doente_medicacao.doente is not None
-        assert doente_medicacao.doente.id == sample_doente.id
-
-        # Test medicacao relationship
+        assert doente_medicacao.doente.id == sample_refs.doente.id
         assert doente_medicacao.medicacao_rel is not None
-        assert doente_medicacao.medicacao_rel.id == sample_medicacao.id
-
-    def test_doente_has_medicacoes_relationship(
-        self,
-        session: Session,
-        sample_doente: Doente,
-        sample_medicacao: Medicacao
-    ):
-        """Test that doente can access its medicacoes."""
-        # Create a relationship
-        doente_medicacao = DoenteMedicacao(
-            doente_id=sample_doente.id,
-            medicacao=sample_medicacao.id,
-            nota="Test relationship"
-        )
-        session.add(doente_medicacao)
-        session.commit()
-
-        # Refresh to load relationships
-        session.refresh(sample_doente)
+        assert doente_medicacao.medicacao_rel.id == sample_refs.medicacao.id
 
         # Test that doente has medicacoes
-        assert len(sample_doente.doente_medicacoes) >= 1
-        assert sample_doente.doente_medicacoes[0].medicacao == sample_medicacao.id
-
-    def test_medicacao_has_doentes_relationship(
-        self,
-        session: Session,
-        sample_doente: Doente,
-        sample_medicacao: Medicacao
-    ):
-        """Test that medicacao can access its doentes."""
-        # Create a relationship
-        doente_medicacao = DoenteMedicacao(
-            doente_id=sample_doente.id,
-            medicacao=sample_medicacao.id,
-            nota="Test relationship"
-        )
-        session.add(doente_medicacao)
-        session.commit()
-
-        # Refresh to load relationships
-        session.refresh(sample_medicacao)
+        assert len(sample_refs.doente.doente_medicacoes) >= 1
+        assert sample_refs.doente.doente_medicacoes[0].medicacao == sample_refs.medicacao.id
 
         # Test that medicacao has doente relationships
-        assert len(sample_medicacao.doente_medicacoes) >= 1
-        assert sample_medicacao.doente_medicacoes[0].doente_id == sample_doente.id
+        assert len(sample_refs.medicacao.doente_medicacoes) >= 1
+        assert sample_refs.medicacao.doente_medicacoes[0].doente_id == sample_refs.doente.id
@@ -3,11 +3,8 @@ from datetime import date
 
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy.pool import StaticPool
-from sqlmodel import Session, SQLModel, create_engine
+from sqlmodel import Session
 
-from src.api import app
-from src.db import get_session
 from src.models.models import (
     Doente,
     DoentePatologia,
@@ -21,60 +18,52 @@ HTTP_404_NOT_FOUND = 404
 HTTP_422_UNPROCESSABLE_ENTITY = 422
 
 
-@pytest.fixture(name="session")
-def session_fixture():
-    """Create a test database session."""
-    engine = create_engine(
-        "sqlite:///:memory:",
-        connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
-    )
-    SQLModel.metadata.create_all(engine)
-
-    with Session(engine) as session:
-        yield session
-
-
-@pytest.fixture(name="client")
-def client_fixture(session: Session):
-    """Create test client with database session."""
-    def get_session_override():
-        return session
-
-    app.dependency_overrides[get_session] = get_session_override
-    client = TestClient(app)
-    yield client
-    app.dependency_overrides.clear()
+@pytest.fixture(name="connection", scope="module")
+def connection_fixture(engine):
+    """Hold one transaction open for the whole module.
+
+    Module-scoped sample rows live in it; the shared ``session`` fixture
+    adds a SAVEPOINT per test so its own writes are rolled back.
+    """
+    connection = engine.connect()
+    transaction = connection.begin()
+    yield connection
+    transaction.rollback()
+    connection.close()
+
+
+def _insert(connection, obj):
+    """Insert a module-level sample row and return it detached."""
+    with Session(
+        bind=connection,
+        join_transaction_mode="create_savepoint",
+        expire_on_commit=False,
+    ) as session:
+        session.add(obj)
+        session.commit()
+    return obj
 
 
-@pytest.fixture(name="sample_doente")
-def sample_doente_fixture(session: Session):
-    """Create a sample patient for testing."""
-    doente = Doente(
+@pytest.fixture(name="sample_doente", scope="module")
+def sample_doente_fixture(connection):
+    """Create a sample patient shared by the module's tests."""
+    return _insert(connection, Doente(
         nome="Test Patient",
         numero_processo=12345,
         data_nascimento=date(1990, 1, 1),
         sexo=SexoEnum.M,
         morada="Test Street"
-    )
-    session.add(doente)
-    session.commit()
-    session.refresh(doente)
-    return doente
+    ))
 
 
-@pytest.fixture(name="sample_patologia")
-def sample_patologia_fixture(session: Session):
-    """Create a sample pathology for testing."""
-    patologia = Patologia(
+@pytest.fixture(name="sample_patologia", scope="module")
+def sample_patologia_fixture(connection):
+    """Create a sample pathology shared by the module's tests."""
+    return _insert(connection, Patologia(
         nome_patologia="Diabetes",
         classe_patologia="Endócrino",
         codigo="E11.9"
-    )
-    session.add(patologia)
-    session.commit()
-    session.refresh(patologia)
-    return patologia
+    ))
 
 
 class TestPatologia:
@@ -118,7 +107,7 @@ class TestPatologia:
         assert response.status_code == HTTP_200_OK
         data = response.json()
         assert isinstance(data, list)
-        assert len(data) >= 1
+        assert len(data) == 1
         assert data[0]["nome_patologia"] == sample_patologia.nome_patologia
 
     def test_get_patologia_by_id(self, client: TestClient, sample_patologia: Patologia):
@@ -229,40 +218,44 @@ class TestDoentePatologia:
     def test_get_all_doentes_patologia(
         self,
         client: TestClient,
+        session: Session,
         sample_doente: Doente,
         sample_patologia: Patologia
     ):
         """Test getting all doente-patologia relationships."""
         # Create a relationship first
-        data = {
-            "doente_id": sample_doente.id,
-            "patologia": sample_patologia.id,
-            "nota": "Test relationship"
-        }
-        client.post("/doentes_patologia", json=data)
+        doente_patologia = DoentePatologia(
+            doente_id=sample_doente.id,
+            patologia=sample_patologia.id,
+            nota="Test relationship"
+        )
+        session.add(doente_patologia)
+        session.commit()
 
         response = client.get("/doentes_patologia")
 
         assert response.status_code == HTTP_200_OK
         response_data = response.json()
         assert isinstance(response_data, list)
-        assert len(response_data) >= 1
+        assert len(response_data) == 1
         assert response_data[0]["doente_id"] == sample_doente.id
 
     def test_get_doente_patologia_by_id(
         self,
         client: TestClient,
+        session: Session,
         sample_doente: Doente,
         sample_patologia: Patologia
     ):
         """Test getting a specific doente-patologia by ID."""
-        data = {
-            "doente_id": sample_doente.id,
-            "patologia": sample_patologia.id,
-            "nota": "Test relationship"
-        }
-        create_response = client.post("/doentes_patologia", json=data)
-        created_id = create_response.json()["id"]
+        doente_patologia = DoentePatologia(
+            doente_id=sample_doente.id,
+            patologia=sample_patologia.id,
+            nota="Test relationship"
+        )
+        session.add(doente_patologia)
+        session.commit()
+        created_id = doente_patologia.id
 
         response = client.get(f"/doentes_patologia/{created_id}")
 
@@ -282,24 +275,26 @@ class TestDoentePatologia:
     def test_get_patologias_by_doente(
         self,
         client: TestClient,
+        session: Session,
         sample_doente: Doente,
         sample_patologia: Patologia
     ):
         """Test getting patologias for a specific doente."""
         # Create a relationship first
-        data = {
-            "doente_id": sample_doente.id,
-            "patologia": sample_patologia.id,
-            "nota": "Test relationship"
-        }
-        client.post("/doentes_patologia", json=data)
+        doente_patologia = DoentePatologia(
+            doente_id=sample_doente.id,
+            patologia=sample_patologia.id,
+            nota="Test relationship"
+        )
+        session.add(doente_patologia)
+        session.commit()
 
         response = client.get(f"/doentes/{sample_doente.id}/patologias")
 
         assert response.status_code == HTTP_200_OK
         response_data = response.json()
         assert isinstance(response_data, list)
-        assert len(response_data) >= 1
+        assert len(response_data) == 1
         assert response_data[0]["doente_id"] == sample_doente.id
         assert response_data[0]["patologia"] == sample_patologia.id
 
@@ -324,14 +319,13 @@ class TestDoentePatologia:
 class TestDatabaseRelationships:
     """Test database relationships for patologia tables."""
 
-    def test_patologia_doente_relationship(
+    def test_relationships_all_directions(
         self,
         session: Session,
         sample_doente: Doente,
         sample_patologia: Patologia
     ):
-        """Test the relationship between patologia and doente."""
-        # Create a relationship
+        """Test every relationship direction on a single doente-patologia."""
         doente_patologia = DoentePatologia(
             doente_id=sample_doente.id,
             patologia=sample_patologia.id,
@@ -339,58 +333,21 @@ class TestDatabaseRelationships:
         )
         session.add(doente_patologia)
         session.commit()
-        session.refresh(doente_patologia)
 
-        # Test forward relationship
+        # Test forward relationships
         assert doente_patologia.doente is not None
         assert doente_patologia.doente.id == sample_doente.id
-
-        # Test patologia relationship
         assert doente_patologia.patologia_rel is not None
         assert doente_patologia.patologia_rel.id == sample_patologia.id
 
-    def test_doente_has_patologias_relationship(
-        self,
-        session: Session,
-        sample_doente: Doente,
-        sample_patologia: Patologia
-    ):
-        """Test that doente can access its patologias."""
-        # Create a relationship
-        doente_patologia = DoentePatologia(
-            doente_id=sample_doente.id,
-            patologia=sample_patologia.id,
-            nota="Test relationship"
-        )
-        session.add(doente_patologia)
-        session.commit()
-
-        # Refresh to load relationships
-        session.refresh(sample_doente)
+        # Load the shared sample rows in this test's session
+        doente = session.get(Doente, sample_doente.id)
+        patologia = session.get(Patologia, sample_patologia.id)
 
         # Test that doente has patologias
-        assert len(sample_doente.doente_patologias) >= 1
-        assert sample_doente.doente_patologias[0].patologia == sample_patologia.id
-
-    def test_patologia_has_doentes_relationship(
-        self,
-        session: Session,
-        sample_doente: Doente,
-        sample_patologia: Patologia
-    ):
-        """Test that patologia can access its doentes."""
-        # Create a relationship
-        doente_patologia = DoentePatologia(
-            doente_id=sample_doente.id,
-            patologia=sample_patologia.id,
-            nota="Test relationship"
-        )
-        session.add(doente_patologia)
-        session.commit()
-
-        # Refresh to load relationships
-        session.refresh(sample_patologia)
+        assert len(doente.doente_patologias) == 1
+        assert doente.doente_patologias[0].patologia == sample_patologia.id
 
         # Test that patologia has doente relationships
-        assert len(sample_patologia.doente_patologias) >= 1
-        assert sample_patologia.doente_patologias[0].doente_id == sample_doente.id
+        assert len(patologia.doente_patologias) == 1
+        assert patologia.doente_patologias[0].doente_id == sample_doente.id
@@ -1,94 +1,20 @@
 # ruff: noqa: PLR6301, PLR2004, E501
-from datetime import date
 
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy.pool import StaticPool
-from sqlmodel import Session, SQLModel, create_engine
+from sqlmodel import Session
 
-from src.api import app
-from src.db import get_session
 from src.models.models import (
-    Doente,
     Internamento,
     InternamentoProcedimento,
-    LesaoInalatorialEnum,
     Procedimento,
-    SexoEnum,
 )
+from tests.helpers import expect
 
-# Test database engine (in memory)
-engine = create_engine(
-    "sqlite:///:memory:",
-    connect_args={"check_same_thread": False},
-    poolclass=StaticPool,
-)
-
-
-def get_test_session():
-    """Create test database session."""
-    with Session(engine) as session:
-        yield session
-
-
-@pytest.fixture
-def session():
-    """Create database tables and yield test session."""
-    SQLModel.metadata.create_all(engine)
-
-    with Session(engine) as session:
-        yield session
-
-    # Clean up
-    try:
-        SQLModel.metadata.drop_all(engine)
-    except Exception:
-        pass  # Ignore cleanup errors
-
-
-@pytest.fixture
-def client(session):
-    """Create test client with overridden dependencies."""
-    def get_test_session():
-        return session
-
-    app.dependency_overrides[get_session] = get_test_session
-
-    with TestClient(app) as test_client:
-        yield test_client
-
-    app.dependency_overrides.clear()
-
-
-@pytest.fixture
-def sample_doente(session: Session):
-    """Create a sample patient for testing."""
-    doente = Doente(
-        nome="Test Patient Procedimento",
-        numero_processo=123456,
-        sexo=SexoEnum.M,
-        morada="Test Street"
-    )
-    session.add(doente)
-    session.commit()
-    session.refresh(doente)
-    return doente
-
-
-@pytest.fixture
-def sample_internamento(session: Session, sample_doente: Doente):
-    """Create a sample internamento for testing."""
-    internamento = Internamento(
-        doente_id=sample_doente.id,
-        numero_internamento=789012,
-        data_entrada=date(2025, 9, 15),
-        ASCQ_total=20,
-        lesao_inalatoria=LesaoInalatorialEnum.NAO
-    )
-    session.add(internamento)
-    session.commit()
-    session.refresh(internamento)
-    return internamento
+# Links created by the list test; more than one so a per-row load shows up.
+LINKED_ROWS = 2
+# Internamento lookup plus the list query.
+MAX_LIST_SELECTS = 2
 
 
 @pytest.fixture
@@ -100,10 +26,28 @@ def sample_procedimento(session: Session):
     )
     session.add(procedimento)
     session.commit()
-    session.refresh(procedimento)
     return procedimento
 
 
+@pytest.fixture
+def make_internamento_procedimento(
+    client: TestClient,
+    sample_internamento: Internamento,
+    sample_procedimento: Procedimento
+):
+    """Return a callable that links the sample rows and returns the JSON."""
+    def _make():
+        data = {
+            "internamento_id": sample_internamento.id,
+            "procedimento": sample_procedimento.id
+        }
+        response = client.post("/internamentos_procedimento", json=data)
+        assert response.status_code == 200
+        return response.json()
+
+    return _make
+
+
 class TestProcedimento:
     """Test cases for Procedimento model and API."""
 
@@ -116,10 +60,7 @@ class TestProcedimento:
 
         response = client.post("/procedimentos", json=procedimento_data)
 
-        assert response.status_code == 200
-        data = response.json()
-        assert data["nome_procedimento"] == "Enxerto de pele"
-        assert data["tipo_procedimento"] == "Cirúrgico"
+        data = expect(response, **procedimento_data)
         assert "id" in data
 
     def test_create_procedimento_minimal(self, client: TestClient):
@@ -130,10 +71,11 @@ class TestProcedimento:
 
         response = client.post("/procedimentos", json=procedimento_data)
 
-        assert response.status_code == 200
-        data = response.json()
-        assert data["nome_procedimento"] == "Debridamento"
-        assert data["tipo_procedimento"] is None
+        expect(
+            response,
+            nome_procedimento="Debridamento",
+            tipo_procedimento=None
+        )
 
     def test_get_all_procedimentos(self, client: TestClient, sample_procedimento: Procedimento):
         """Test getting all procedimentos."""
@@ -149,28 +91,18 @@ class TestProcedimento:
         """Test getting a specific procedimento by ID."""
         response = client.get(f"/procedimentos/{sample_procedimento.id}")
 
-        assert response.status_code == 200
-        data = response.json()
-        assert data["nome_procedimento"] == sample_procedimento.nome_procedimento
-        assert data["tipo_procedimento"] == sample_procedimento.tipo_procedimento
-        assert data["id"] == sample_procedimento.id
+        expect(
+            response,
+            id=sample_procedimento.id,
+            nome_procedimento=sample_procedimento.nome_procedimento,
+            tipo_procedimento=sample_procedimento.tipo_procedimento
+        )
 
     def test_get_nonexistent_procedimento(self, client: TestClient):
         """Test getting a non-existent procedimento."""
         response = client.get("/procedimentos/999")
 
-        assert response.status_code == 404
-        assert response.json()["detail"] == "Procedimento not found"
-
-    def test_procedimento_required_fields(self, client: TestClient):
-        """Test that nome_procedimento is required."""
-        procedimento_data = {
-            "tipo_procedimento": "Cirúrgico"
-        }
-
-        response = client.post("/procedimentos", json=procedimento_data)
-
-        assert response.status_code == 422
+        expect(response, 404, detail="Procedimento not found")
 
 
 class TestInternamentoProcedimento:
@@ -190,10 +122,7 @@ class TestInternamentoProcedimento:
 
         response = client.post("/internamentos_procedimento", json=data)
 
-        assert response.status_code == 200
-        response_data = response.json()
-        assert response_data["internamento_id"] == sample_internamento.id
-        assert response_data["procedimento"] == sample_procedimento.id
+        response_data = expect(response, **data)
         assert "id" in response_data
 
     def test_create_internamento_procedimento_minimal(
@@ -208,10 +137,11 @@ class TestInternamentoProcedimento:
 
         response = client.post("/internamentos_procedimento", json=data)
 
-        assert response.status_code == 200
-        response_data = response.json()
-        assert response_data["internamento_id"] == sample_internamento.id
-        assert response_data["procedimento"] is None
+        expect(
+            response,
+            internamento_id=sample_internamento.id,
+            procedimento=None
+        )
 
     def test_create_internamento_procedimento_invalid_internamento(
         self,
@@ -225,8 +155,7 @@ class TestInternamentoProcedimento:
 
         response = client.post("/internamentos_procedimento", json=data)
 
-        assert response.status_code == 404
-        assert response.json()["detail"] == "Internamento not found"
+        expect(response, 404, detail="Internamento not found")
 
     def test_create_internamento_procedimento_invalid_procedimento(
         self,
@@ -241,22 +170,17 @@ class TestInternamentoProcedimento:
 
         response = client.post("/internamentos_procedimento", json=data)
 
-        assert response.status_code == 404
-        assert response.json()["detail"] == "Procedimento not found"
+        expect(response, 404, detail="Procedimento not found")
 
     def test_get_all_internamentos_procedimento(
         self,
         client: TestClient,
         sample_internamento: Internamento,
-        sample_procedimento: Procedimento
+        sample_procedimento: Procedimento,
+        make_internamento_procedimento
     ):
         """Test getting all internamento-procedimento relationships."""
-        # Create a relationship first
-        data = {
-            "internamento_id": sample_internamento.id,
-            "procedimento": sample_procedimento.id
-        }
-        client.post("/internamentos_procedimento", json=data)
+        make_internamento_procedimento()
 
         response = client.get("/internamentos_procedimento")
 
@@ -270,52 +194,49 @@ class TestInternamentoProcedimento:
         self,
         client: TestClient,
         sample_internamento: Internamento,
-        sample_procedimento: Procedimento
+        sample_procedimento: Procedimento,
+        make_internamento_procedimento
     ):
         """Test getting a specific internamento-procedimento by ID."""
-        # Create a relationship first
-        data = {
-            "internamento_id": sample_internamento.id,
-            "procedimento": sample_procedimento.id
-        }
-        create_response = client.post("/internamentos_procedimento", json=data)
-        created_id = create_response.json()["id"]
+        created_id = make_internamento_procedimento()["id"]
 
         response = client.get(f"/internamentos_procedimento/{created_id}")
 
-        assert response.status_code == 200
-        response_data = response.json()
-        assert response_data["internamento_id"] == sample_internamento.id
-        assert response_data["procedimento"] == sample_procedimento.id
-        assert response_data["id"] == created_id
+        expect(
+            response,
+            id=created_id,
+            internamento_id=sample_internamento.id,
+            procedimento=sample_procedimento.id
+        )
 
     def test_get_nonexistent_internamento_procedimento(self, client: TestClient):
         """Test getting a non-existent internamento-procedimento."""
         response = client.get("/internamentos_procedimento/999")
 
-        assert response.status_code == 404
-        assert response.json()["detail"] == "Internamento procedimento not found"
+        expect(response, 404, detail="Internamento procedimento not found")
 
     def test_get_procedimentos_by_internamento(
         self,
         client: TestClient,
         sample_internamento: Internamento,
-        sample_procedimento: Procedimento
+        sample_procedimento: Procedimento,
+        make_internamento_procedimento,
+        query_counter: list[str]
     ):
         """Test getting procedimentos for a specific internamento."""
-        # Create a relationship first
-        data = {
-            "internamento_id": sample_internamento.id,
-            "procedimento": sample_procedimento.id
-        }
-        client.post("/internamentos_procedimento", json=data)
+        for _ in range(LINKED_ROWS):
+            make_internamento_procedimento()
 
+        query_counter.clear()
         response = client.get(f"/internamentos/{sample_internamento.id}/procedimentos")
 
         assert response.status_code == 200
+        # More SELECTs than this means an N+1 crept in.
+        selects = [s for s in query_counter if s.lstrip().upper().startswith("SELECT")]
+        assert len(selects) <= MAX_LIST_SELECTS
         response_data = response.json()
         assert isinstance(response_data, list)
-        assert len(response_data) >= 1
+        assert len(response_data) == LINKED_ROWS
         assert response_data[0]["internamento_id"] == sample_internamento.id
         assert response_data[0]["procedimento"] == sample_procedimento.id
 
@@ -323,18 +244,22 @@ class TestInternamentoProcedimento:
         """Test getting procedimentos for non-existent internamento."""
         response = client.get("/internamentos/999/procedimentos")
 
-        assert response.status_code == 404
-        assert response.json()["detail"] == "Internamento not found"
+        expect(response, 404, detail="Internamento not found")
 
-    def test_internamento_procedimento_required_fields(self, client: TestClient):
-        """Test that internamento_id is required."""
-        data = {
-            "procedimento": 1
-        }
 
-        response = client.post("/internamentos_procedimento", json=data)
+@pytest.mark.parametrize(
+    ("endpoint", "payload"),
+    [
+        ("/procedimentos", {"tipo_procedimento": "Cirúrgico"}),
+        ("/internamentos_procedimento", {"procedimento": 1}),
+    ],
+    ids=["procedimento_without_nome", "link_without_internamento"],
+)
+def test_missing_required_field(client: TestClient, endpoint: str, payload: dict):
+    """Test that each create endpoint rejects a payload missing its key field."""
+    response = client.post(endpoint, json=payload)
 
-        assert response.status_code == 422
+    assert response.status_code == 422
 
 
 class TestDatabaseRelationships:
@@ -353,8 +278,7 @@ class TestDatabaseRelationships:
             procedimento=sample_procedimento.id
         )
         session.add(internamento_procedimento)
-        session.commit()
-        session.refresh(internamento_procedimento)
+        session.flush()
 
         # Test forward relationship
         assert internamento_procedimento.internamento is not None
@@ -377,7 +301,7 @@ class TestDatabaseRelationships:
             procedimento=sample_procedimento.id
         )
         session.add(internamento_procedimento)
-        session.commit()
+        session.flush()
 
         # Refresh to load relationships
         session.refresh(sample_internamento)
@@ -399,7 +323,7 @@ class TestDatabaseRelationships:
             procedimento=sample_procedimento.id
         )
         session.add(internamento_procedimento)
-        session.commit()
+        session.flush()
 
         # Refresh to load relationships
         session.refresh(sample_procedimento)
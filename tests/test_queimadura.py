@@ -1,72 +1,37 @@
 """Tests for Queimadura API endpoints with proper foreign key relationships."""
 
-import random
-from datetime import date
-
 import pytest
-from fastapi.testclient import TestClient
+from httpx import AsyncClient
 from sqlmodel import Session
 
-from src.api import app
-from src.db import get_session
 from src.models.models import (
     Doente,
     Internamento,
-    LesaoInalatorialEnum,
     LocalAnatomico,
-    SexoEnum,
 )
+from tests.helpers import expect
+
+pytestmark = pytest.mark.anyio
 
 # HTTP Status Code Constants
 HTTP_200_OK = 200
 HTTP_201_CREATED = 201
 HTTP_404_NOT_FOUND = 404
 HTTP_422_UNPROCESSABLE_ENTITY = 422
-MIN_EXPECTED_RECORDS = 2
-
-
-@pytest.fixture
-def client():
-    """Create test client."""
-    return TestClient(app)
+# Queimaduras created by each list test.
+CREATED_RECORDS = 2
+INVALID_ID = 999
+# Body fields shared by the queimadura payloads; tests override what differs.
+QUEIMADURA_TMPL = {'grau_maximo': 'SEGUNDO', 'notas': 'Test queimadura'}
+# Internamento lookup plus the list query, with one to spare.
+MAX_LIST_SELECTS = 3
 
 
 @pytest.fixture
-def session():
-    """Create test database session."""
-    return next(get_session())
-
-
-@pytest.fixture
-def setup_test_data(session: Session):
+def setup_test_data(
+    session: Session, sample_doente: Doente, sample_internamento: Internamento
+):
     """Set up test data for queimadura tests."""
-    # Generate unique numbers to avoid conflicts
-    unique_processo = random.randint(100000, 999999)
-    unique_internamento = random.randint(100000, 999999)
-
-    # Create a patient
-    doente = Doente(
-        nome='Test Patient',
-        numero_processo=unique_processo,
-        sexo=SexoEnum.M,
-        morada='Test Street',
-    )
-    session.add(doente)
-    session.commit()
-    session.refresh(doente)
-
-    # Create an internamento
-    internamento = Internamento(
-        numero_internamento=unique_internamento,
-        doente_id=doente.id,
-        data_entrada=date(2025, 9, 11),
-        ASCQ_total=20,
-        lesao_inalatoria=LesaoInalatorialEnum.SIM,
-    )
-    session.add(internamento)
-    session.commit()
-    session.refresh(internamento)
-
     # Create local anatómicos
     local1 = LocalAnatomico(
         local_anatomico='Braço', regiao_anatomica='Membro superior'
@@ -74,186 +39,187 @@ def setup_test_data(session: Session):
     local2 = LocalAnatomico(
         local_anatomico='Perna', regiao_anatomica='Membro inferior'
     )
-    session.add(local1)
-    session.add(local2)
+    session.add_all([local1, local2])
     session.commit()
-    session.refresh(local1)
-    session.refresh(local2)
 
     return {
-        'doente': doente,
-        'internamento': internamento,
+        'doente': sample_doente,
+        'internamento': sample_internamento,
         'local1': local1,
         'local2': local2,
     }
 
 
-def test_create_queimadura(client: TestClient, setup_test_data):
+@pytest.fixture
+def make_queimadura(aclient: AsyncClient, setup_test_data):
+    """Return a callable that creates a queimadura and returns its JSON."""
+    data = setup_test_data
+
+    async def _make(local='local1', **fields):
+        response = await aclient.post(
+            '/queimaduras',
+            json={
+                **QUEIMADURA_TMPL,
+                'internamento_id': data['internamento'].id,
+                'local_anatomico': data[local].id,
+                **fields,
+            },
+        )
+        assert response.status_code == HTTP_201_CREATED
+        return response.json()
+
+    return _make
+
+
+async def test_create_queimadura(aclient: AsyncClient, setup_test_data):
     """Test creating a new queimadura."""
     data = setup_test_data
+    payload = {
+        **QUEIMADURA_TMPL,
+        'internamento_id': data['internamento'].id,
+        'local_anatomico': data['local1'].id,
+    }
 
-    response = client.post(
-        '/queimaduras',
-        json={
-            'internamento_id': data['internamento'].id,
-            'local_anatomico': data['local1'].id,
-            'grau_maximo': 'SEGUNDO',
-            'notas': 'Test queimadura',
-        },
-    )
-    assert response.status_code == HTTP_201_CREATED
-    result = response.json()
-    assert result['internamento_id'] == data['internamento'].id
-    assert result['local_anatomico'] == data['local1'].id
-    assert result['grau_maximo'] == 'SEGUNDO'
-    assert result['notas'] == 'Test queimadura'
+    response = await aclient.post('/queimaduras', json=payload)
+    result = expect(response, HTTP_201_CREATED, **payload)
     assert 'id' in result
 
 
-def test_create_queimadura_invalid_internamento(
-    client: TestClient, setup_test_data
+async def test_create_queimadura_invalid_internamento(
+    aclient: AsyncClient, setup_test_data
 ):
     """Test creating queimadura with invalid internamento."""
     data = setup_test_data
 
-    response = client.post(
+    response = await aclient.post(
         '/queimaduras',
         json={
-            'internamento_id': 999,  # Invalid internamento
+            **QUEIMADURA_TMPL,
+            'internamento_id': INVALID_ID,
             'local_anatomico': data['local1'].id,
-            'grau_maximo': 'SEGUNDO',
-            'notas': 'Test queimadura',
         },
     )
     assert response.status_code == HTTP_404_NOT_FOUND
     assert 'Internamento not found' in response.json()['detail']
 
 
-def test_get_all_queimaduras(client: TestClient, setup_test_data):
+async def test_get_all_queimaduras(aclient: AsyncClient, make_queimadura):
     """Test getting all queimaduras."""
-    data = setup_test_data
-
-    # Create some queimaduras
-    client.post(
-        '/queimaduras',
-        json={
-            'internamento_id': data['internamento'].id,
-            'local_anatomico': data['local1'].id,
-            'grau_maximo': 'PRIMEIRO',
-            'notas': 'Queimadura 1',
-        },
-    )
-    client.post(
-        '/queimaduras',
-        json={
-            'internamento_id': data['internamento'].id,
-            'local_anatomico': data['local2'].id,
-            'grau_maximo': 'TERCEIRO',
-            'notas': 'Queimadura 2',
-        },
+    await make_queimadura(grau_maximo='PRIMEIRO', notas='Queimadura 1')
+    await make_queimadura(
+        'local2', grau_maximo='TERCEIRO', notas='Queimadura 2'
     )
 
-    response = client.get('/queimaduras')
+    response = await aclient.get('/queimaduras')
     assert response.status_code == HTTP_200_OK
     result = response.json()
-    assert len(result) >= MIN_EXPECTED_RECORDS
+    assert len(result) == CREATED_RECORDS
     assert all('internamento_id' in item for item in result)
 
 
-def test_get_queimadura_by_id(client: TestClient, setup_test_data):
+async def test_get_queimadura_by_id(aclient: AsyncClient, make_queimadura):
     """Test getting a specific queimadura by ID."""
-    data = setup_test_data
-
-    # Create a queimadura
-    create_response = client.post(
-        '/queimaduras',
-        json={
-            'internamento_id': data['internamento'].id,
-            'local_anatomico': data['local1'].id,
-            'grau_maximo': 'SEGUNDO',
-            'notas': 'Test queimadura ID',
-        },
-    )
-    queimadura_id = create_response.json()['id']
+    created = await make_queimadura(notas='Test queimadura ID')
 
-    # Get it by ID
-    response = client.get(f'/queimaduras/{queimadura_id}')
-    assert response.status_code == HTTP_200_OK
-    result = response.json()
-    assert result['notas'] == 'Test queimadura ID'
+    response = await aclient.get(f'/queimaduras/{created["id"]}')
+    expect(response, notas='Test queimadura ID')
 
 
-def test_queimadura_grau_maximo_enum(client: TestClient, setup_test_data):
+@pytest.mark.parametrize('grau', ['PRIMEIRO', 'SEGUNDO', 'TERCEIRO', 'QUARTO'])
+async def test_queimadura_grau_maximo_enum(make_queimadura, grau: str):
     """Test all valid grau maximo enum values."""
-    data = setup_test_data
-
-    for grau in ['PRIMEIRO', 'SEGUNDO', 'TERCEIRO', 'QUARTO']:
-        response = client.post(
-            '/queimaduras',
-            json={
-                'internamento_id': data['internamento'].id,
-                'local_anatomico': data['local1'].id,
-                'grau_maximo': grau,
-                'notas': f'Queimadura {grau}',
-            },
-        )
-        assert response.status_code == HTTP_201_CREATED
-        assert response.json()['grau_maximo'] == grau
+    created = await make_queimadura(
+        grau_maximo=grau, notas=f'Queimadura {grau}'
+    )
+    assert created['grau_maximo'] == grau
 
 
-def test_queimadura_optional_fields(client: TestClient, setup_test_data):
+async def test_queimadura_optional_fields(
+    aclient: AsyncClient, setup_test_data
+):
     """Test queimadura with optional fields."""
     data = setup_test_data
 
     # Test with minimal required fields
-    response = client.post(
+    response = await aclient.post(
         '/queimaduras', json={'internamento_id': data['internamento'].id}
     )
-    assert response.status_code == HTTP_201_CREATED
-    result = response.json()
-    assert result['local_anatomico'] is None
-    assert result['grau_maximo'] is None
-    assert result['notas'] is None
+    expect(
+        response,
+        HTTP_201_CREATED,
+        local_anatomico=None,
+        grau_maximo=None,
+        notas=None,
+    )
 
 
-def test_queimadura_required_internamento_id(client: TestClient):
-    """Test that internamento_id is required."""
-    response = client.post(
-        '/queimaduras',
-        json={'local_anatomico': 1, 'grau_maximo': 'SEGUNDO', 'notas': 'Test'},
-    )
-    assert response.status_code == HTTP_422_UNPROCESSABLE_ENTITY
+@pytest.mark.parametrize(
+    ('path', 'expected'),
+    [
+        ('/queimaduras', HTTP_200_OK),
+        (f'/queimaduras/{INVALID_ID}', HTTP_404_NOT_FOUND),
+        (f'/internamentos/{INVALID_ID}/queimaduras', HTTP_404_NOT_FOUND),
+    ],
+    ids=['list_empty', 'missing_queimadura', 'missing_internamento'],
+)
+async def test_queimadura_read_endpoints(aclient: AsyncClient, path, expected):
+    """Test the read-only endpoints against an empty database."""
+    response = await aclient.get(path)
+    assert response.status_code == expected
+
+
+@pytest.mark.parametrize(
+    ('payload', 'status'),
+    [
+        (
+            {'local_anatomico': 1, 'grau_maximo': 'SEGUNDO'},
+            HTTP_422_UNPROCESSABLE_ENTITY,
+        ),
+        (
+            {'internamento_id': INVALID_ID, 'grau_maximo': 'QUINTO'},
+            HTTP_422_UNPROCESSABLE_ENTITY,
+        ),
+        (
+            {'internamento_id': INVALID_ID, 'local_anatomico': 'x'},
+            HTTP_422_UNPROCESSABLE_ENTITY,
+        ),
+        (
+            {'internamento_id': INVALID_ID, 'grau_maximo': 'SEGUNDO'},
+            HTTP_404_NOT_FOUND,
+        ),
+    ],
+    ids=[
+        'missing_internamento_id',
+        'invalid_grau',
+        'invalid_local',
+        'unknown_internamento',
+    ],
+)
+async def test_queimadura_rejected_payload(
+    aclient: AsyncClient, payload: dict, status: int
+):
+    """Test that malformed or dangling queimadura payloads are rejected."""
+    response = await aclient.post('/queimaduras', json=payload)
+    assert response.status_code == status
 
 
-def test_get_queimaduras_for_internamento(client: TestClient, setup_test_data):
+async def test_get_queimaduras_for_internamento(
+    aclient: AsyncClient, setup_test_data, make_queimadura, query_counter
+):
     """Test getting queimaduras for a specific internamento."""
-    data = setup_test_data
+    await make_queimadura(grau_maximo='PRIMEIRO', notas='Queimadura 1')
+    await make_queimadura('local2', notas='Queimadura 2')
 
-    # Create queimaduras for this internamento
-    client.post(
-        '/queimaduras',
-        json={
-            'internamento_id': data['internamento'].id,
-            'local_anatomico': data['local1'].id,
-            'grau_maximo': 'PRIMEIRO',
-            'notas': 'Queimadura 1',
-        },
-    )
-    client.post(
-        '/queimaduras',
-        json={
-            'internamento_id': data['internamento'].id,
-            'local_anatomico': data['local2'].id,
-            'grau_maximo': 'SEGUNDO',
-            'notas': 'Queimadura 2',
-        },
+    internamento_id = setup_test_data['internamento'].id
+    query_counter.clear()
+    response = await aclient.get(
+        f'/internamentos/{internamento_id}/queimaduras'
     )
-
-    internamento_id = data['internamento'].id
-    response = client.get(f'/internamentos/{internamento_id}/queimaduras')
     assert response.status_code == HTTP_200_OK
+    selects = [
+        s for s in query_counter if s.lstrip().upper().startswith('SELECT')
+    ]
+    assert len(selects) <= MAX_LIST_SELECTS
     result = response.json()
-    assert len(result) >= MIN_EXPECTED_RECORDS
-    assert all(
-        item['internamento_id'] == data['internamento'].id for item in result
-    )
+    assert len(result) == CREATED_RECORDS
+    assert all(item['internamento_id'] == internamento_id for item in result)
@@ -1,21 +1,10 @@
 """Tests for trauma and traumaTipo functionality."""
 
-from datetime import date
-
 import pytest
 from fastapi.testclient import TestClient
-from sqlmodel import Session, SQLModel, create_engine
-from sqlmodel.pool import StaticPool
-
-from src.api import app
-from src.db import get_session
-from src.models.models import (
-    Doente,
-    Internamento,
-    LesaoInalatorialEnum,
-    SexoEnum,
-    TraumaTipo,
-)
+from sqlmodel import Session
+
+from src.models.models import Trauma, TraumaTipo
 
 # HTTP Status Code Constants
 HTTP_200_OK = 200
@@ -24,72 +13,6 @@ HTTP_422_UNPROCESSABLE_ENTITY = 422
 HTTP_STATUS_COUNT_TWO = 2
 
 
-@pytest.fixture(name="engine")
-def engine_fixture():
-    """Create a test database engine."""
-    engine = create_engine(
-        "sqlite://",
-        connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
-    )
-    SQLModel.metadata.create_all(engine)
-    yield engine
-    # Ensure engine is properly disposed
-    engine.dispose()
-
-
-@pytest.fixture(name="session")
-def session_fixture(engine):
-    """Create a test database session."""
-    with Session(engine) as session:
-        yield session
-        # Session is automatically closed by context manager
-
-
-@pytest.fixture(name="client")
-def client_fixture(session: Session):
-    """Create test client with session dependency override."""
-    def get_session_override():
-        return session
-
-    app.dependency_overrides[get_session] = get_session_override
-    client = TestClient(app)
-    yield client
-    app.dependency_overrides.clear()
-
-
-@pytest.fixture(name="sample_doente")
-def sample_doente_fixture(session: Session):
-    """Create sample patient for testing."""
-    doente = Doente(
-        nome="Test Patient",
-        numero_processo=12345,
-        data_nascimento=date(1990, 1, 1),
-        sexo=SexoEnum.M,
-        morada="Test Address",
-    )
-    session.add(doente)
-    session.commit()
-    session.refresh(doente)
-    return doente
-
-
-@pytest.fixture(name="sample_internamento")
-def sample_internamento_fixture(session: Session, sample_doente):
-    """Create sample internamento for testing."""
-    internamento = Internamento(
-        numero_internamento=54321,
-        data_entrada=date(2025, 1, 15),
-        ASCQ_total=25,
-        lesao_inalatoria=LesaoInalatorialEnum.NAO,
-        doente_id=sample_doente.id,
-    )
-    session.add(internamento)
-    session.commit()
-    session.refresh(internamento)
-    return internamento
-
-
 @pytest.fixture(name="sample_traumatipo")
 def sample_traumatipo_fixture(session: Session):
     """Create sample trauma tipo for testing."""
@@ -99,10 +22,27 @@ def sample_traumatipo_fixture(session: Session):
     )
     session.add(traumatipo)
     session.commit()
-    session.refresh(traumatipo)
     return traumatipo
 
 
+@pytest.fixture(name="seeded_traumas")
+def seeded_traumas_fixture(
+    session: Session, sample_internamento, sample_traumatipo
+):
+    """Insert two traumas for the sample internamento in one commit."""
+    traumas = [
+        Trauma(
+            internamento_id=sample_internamento.id,
+            tipo_local=sample_traumatipo.id,
+            cirurgia_urgente=True,
+        ),
+        Trauma(internamento_id=sample_internamento.id, cirurgia_urgente=False),
+    ]
+    session.add_all(traumas)
+    session.commit()
+    return traumas
+
+
 class TestTraumaTipo:
     """Tests for TraumaTipo functionality."""
 
@@ -149,25 +89,6 @@ class TestTraumaTipo:
         assert data["local"] == "Crânio"
         assert data["tipo"] == "Traumatismo craneoencefálico"
 
-    @staticmethod
-    def test_get_traumatipo_not_found(client: TestClient):
-        """Test getting non-existent traumatipo."""
-        response = client.get("/tipos_trauma/999")
-        assert response.status_code == HTTP_404_NOT_FOUND
-        expected_response = {"detail": "Tipo de trauma not found"}
-        assert response.json() == expected_response
-
-    @staticmethod
-    def test_traumatipo_required_fields(client: TestClient):
-        """Test traumatipo creation with missing required fields."""
-        # Missing local
-        response = client.post("/tipos_trauma", json={"tipo": "Test"})
-        assert response.status_code == HTTP_422_UNPROCESSABLE_ENTITY
-
-        # Missing tipo
-        response = client.post("/tipos_trauma", json={"local": "Test"})
-        assert response.status_code == HTTP_422_UNPROCESSABLE_ENTITY
-
     @staticmethod
     def test_traumatipo_audit_fields(client: TestClient):
         """Test that audit fields are automatically set."""
@@ -186,41 +107,40 @@ class TestTrauma:
     """Tests for Trauma functionality."""
 
     @staticmethod
-    def test_create_trauma(
-        client: TestClient, sample_internamento, sample_traumatipo
+    @pytest.mark.parametrize(
+        ("with_tipo_local", "cirurgia_urgente"),
+        [(True, True), (True, False), (False, False)],
+        ids=["with_tipo_urgent", "with_tipo", "optional_fields_only"],
+    )
+    def test_create_and_read_trauma(
+        client: TestClient,
+        sample_internamento,
+        sample_traumatipo,
+        with_tipo_local: bool,
+        cirurgia_urgente: bool,
     ):
-        """Test creating a new trauma."""
+        """Test that a created trauma reads back by ID and in the list."""
         trauma_data = {
             "internamento_id": sample_internamento.id,
-            "tipo_local": sample_traumatipo.id,
-            "cirurgia_urgente": True
+            "cirurgia_urgente": cirurgia_urgente,
         }
-        response = client.post("/traumas", json=trauma_data)
+        if with_tipo_local:
+            trauma_data["tipo_local"] = sample_traumatipo.id
+        expected = {"tipo_local": None, **trauma_data}
 
+        response = client.post("/traumas", json=trauma_data)
         assert response.status_code == HTTP_200_OK
-        data = response.json()
-        assert data["internamento_id"] == sample_internamento.id
-        assert data["tipo_local"] == sample_traumatipo.id
-        assert data["cirurgia_urgente"] is True
-        assert "id" in data
-        assert data["id"] is not None
+        created = response.json()
+        assert created["id"] is not None
+        assert {key: created[key] for key in expected} == expected
 
-    @staticmethod
-    def test_create_trauma_optional_fields(
-        client: TestClient, sample_internamento
-    ):
-        """Test creating trauma with optional fields only."""
-        trauma_data = {
-            "internamento_id": sample_internamento.id,
-            "cirurgia_urgente": False
-        }
-        response = client.post("/traumas", json=trauma_data)
+        response = client.get(f"/traumas/{created['id']}")
+        assert response.status_code == HTTP_200_OK
+        assert response.json() == created
 
+        response = client.get("/traumas")
         assert response.status_code == HTTP_200_OK
-        data = response.json()
-        assert data["internamento_id"] == sample_internamento.id
-        assert data["tipo_local"] is None
-        assert data["cirurgia_urgente"] is False
+        assert response.json() == [created]
 
     @staticmethod
     def test_create_trauma_invalid_internamento(
@@ -261,100 +181,20 @@ class TestTrauma:
         assert response.status_code == HTTP_200_OK
         assert response.json() == []
 
-    @staticmethod
-    def test_get_all_traumas(
-        client: TestClient, sample_internamento, sample_traumatipo
-    ):
-        """Test getting all traumas."""
-        # Create trauma first
-        trauma_data = {
-            "internamento_id": sample_internamento.id,
-            "tipo_local": sample_traumatipo.id,
-            "cirurgia_urgente": True
-        }
-        client.post("/traumas", json=trauma_data)
-
-        response = client.get("/traumas")
-        assert response.status_code == HTTP_200_OK
-        data = response.json()
-        assert len(data) == 1
-        assert data[0]["internamento_id"] == sample_internamento.id
-        assert data[0]["tipo_local"] == sample_traumatipo.id
-        assert data[0]["cirurgia_urgente"] is True
-
-    @staticmethod
-    def test_get_trauma_by_id(
-        client: TestClient, sample_internamento, sample_traumatipo
-    ):
-        """Test getting trauma by ID."""
-        # Create trauma first
-        trauma_data = {
-            "internamento_id": sample_internamento.id,
-            "tipo_local": sample_traumatipo.id,
-            "cirurgia_urgente": False
-        }
-        create_response = client.post("/traumas", json=trauma_data)
-        trauma_id = create_response.json()["id"]
-
-        response = client.get(f"/traumas/{trauma_id}")
-        assert response.status_code == HTTP_200_OK
-        data = response.json()
-        assert data["id"] == trauma_id
-        assert data["internamento_id"] == sample_internamento.id
-        assert data["tipo_local"] == sample_traumatipo.id
-        assert data["cirurgia_urgente"] is False
-
-    @staticmethod
-    def test_get_trauma_not_found(client: TestClient):
-        """Test getting non-existent trauma."""
-        response = client.get("/traumas/999")
-        assert response.status_code == HTTP_404_NOT_FOUND
-        expected_response = {"detail": "Trauma not found"}
-        assert response.json() == expected_response
-
     @staticmethod
     def test_get_traumas_by_internamento(
-        client: TestClient, sample_internamento, sample_traumatipo
+        client: TestClient, sample_internamento, seeded_traumas
     ):
         """Test getting traumas for specific internamento."""
-        # Create multiple traumas for the same internamento
-        trauma_data_1 = {
-            "internamento_id": sample_internamento.id,
-            "tipo_local": sample_traumatipo.id,
-            "cirurgia_urgente": True
-        }
-        trauma_data_2 = {
-            "internamento_id": sample_internamento.id,
-            "cirurgia_urgente": False
-        }
-
-        client.post("/traumas", json=trauma_data_1)
-        client.post("/traumas", json=trauma_data_2)
-
         endpoint = f"/internamentos/{sample_internamento.id}/traumas"
         response = client.get(endpoint)
         assert response.status_code == HTTP_200_OK
         data = response.json()
-        assert len(data) == HTTP_STATUS_COUNT_TWO
+        assert len(data) == len(seeded_traumas)
         # All traumas should belong to this internamento
         for trauma in data:
             assert trauma["internamento_id"] == sample_internamento.id
 
-    @staticmethod
-    def test_get_traumas_by_nonexistent_internamento(client: TestClient):
-        """Test getting traumas for non-existent internamento."""
-        response = client.get("/internamentos/999/traumas")
-        assert response.status_code == HTTP_404_NOT_FOUND
-        expected_response = {"detail": "Internamento not found"}
-        assert response.json() == expected_response
-
-    @staticmethod
-    def test_trauma_required_fields(client: TestClient):
-        """Test trauma creation with missing required fields."""
-        # Missing internamento_id
-        response = client.post("/traumas", json={"cirurgia_urgente": True})
-        assert response.status_code == HTTP_422_UNPROCESSABLE_ENTITY
-
     @staticmethod
     def test_trauma_audit_fields(client: TestClient, sample_internamento):
         """Test that audit fields are automatically set."""
@@ -443,3 +283,35 @@ class TestTraumaEdgeCases:
         assert response.status_code == HTTP_200_OK
         data = response.json()
         assert data["cirurgia_urgente"] is None
+
+
+@pytest.mark.parametrize(
+    ("url", "detail"),
+    [
+        ("/tipos_trauma/999", "Tipo de trauma not found"),
+        ("/traumas/999", "Trauma not found"),
+        ("/internamentos/999/traumas", "Internamento not found"),
+    ],
+    ids=["traumatipo", "trauma", "traumas_by_internamento"],
+)
+def test_not_found(client: TestClient, url: str, detail: str):
+    """Test that unknown ids return 404 with the route's message."""
+    response = client.get(url)
+    assert response.status_code == HTTP_404_NOT_FOUND
+    assert response.json() == {"detail": detail}
+
+
+@pytest.mark.parametrize(
+    ("url", "payload"),
+    [
+        ("/tipos_trauma", {"tipo": "Test"}),
+        ("/tipos_trauma", {"local": "Test"}),
+        ("/traumas", {"cirurgia_urgente": True}),
+    ],
+    ids=["traumatipo_without_local", "traumatipo_without_tipo",
+         "trauma_without_internamento"],
+)
+def test_missing_required_field(client: TestClient, url: str, payload: dict):
+    """Test that creation fails when a required field is missing."""
+    response = client.post(url, json=payload)
+    assert response.status_code == HTTP_422_UNPROCESSABLE_ENTITY